@@ -1,8 +1,16 @@
 import sys
 import sqlite3
 import hashlib
+import functools
+import hmac
+import secrets
+import threading
+import queue
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import pandas as pd
+import numpy as np
+import xlsxwriter
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -14,20 +22,125 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import json
  
+PBKDF2_ITERATIONS = 100_000
+
+def hash_password(password, salt):
+    """Derive the stored password hash with salted PBKDF2-HMAC-SHA256"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS).hex()
+
+@functools.lru_cache(maxsize=32)
+def _pw_digest(password, salt):
+    """Memoized hash_password so repeated login retries skip the PBKDF2 work"""
+    return hash_password(password, salt)
+
+# Hot queries. Reusing the same SQL text lets each connection's statement cache
+# hand back the already-prepared statement instead of re-parsing it.
+Q_COUNTS = "SELECT (SELECT COUNT(*) FROM items), (SELECT COUNT(*) FROM categories)"
+Q_LOW_STOCK = "SELECT name, quantity FROM items WHERE quantity <= min_stock"
+Q_RECENT = "SELECT name, date_added FROM items ORDER BY date_added DESC LIMIT 5"
+Q_TOP_STOCK = "SELECT name, quantity FROM items ORDER BY quantity DESC LIMIT 10"
+Q_LOAD_ITEMS = """
+    SELECT i.id, i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.date_added
+    FROM items i LEFT JOIN categories c ON i.category_id = c.id
+"""
+Q_LOAD_ITEMS_BY_CATEGORY = Q_LOAD_ITEMS + "WHERE i.category_id = ?"
+Q_LOAD_CATEGORIES = "SELECT id, name FROM categories"
+Q_INSERT_ITEM = """
+    INSERT INTO items (name, category_id, quantity, price, min_stock, supplier, date_added)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Report and export queries
+Q_HAS_ITEMS = "SELECT EXISTS (SELECT 1 FROM items)"
+Q_LOW_STOCK_REPORT = """
+    SELECT i.name, c.name, i.quantity, i.min_stock
+    FROM items i LEFT JOIN categories c ON i.category_id = c.id
+    WHERE i.quantity <= i.min_stock
+    ORDER BY i.quantity ASC
+"""
+Q_INVENTORY_REPORT = """
+    SELECT i.name, c.name, i.quantity, i.price, i.supplier,
+           i.quantity * i.price AS value, SUM(i.quantity * i.price) OVER () AS grand_total
+    FROM items i LEFT JOIN categories c ON i.category_id = c.id
+    ORDER BY i.name
+"""
+Q_CATEGORY_REPORT = """
+    SELECT c.name, COUNT(i.id) as item_count, SUM(i.quantity * i.price) as total_value
+    FROM categories c LEFT JOIN items i ON c.id = i.category_id
+    GROUP BY c.id, c.name
+    ORDER BY total_value DESC
+"""
+Q_EXPORT_EXCEL = """
+    SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.date_added
+    FROM items i LEFT JOIN categories c ON i.category_id = c.id
+"""
+Q_EXPORT_PDF = """
+    SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier
+    FROM items i LEFT JOIN categories c ON i.category_id = c.id
+"""
+
+# Report templates: parsed once by str.format per item instead of one f-string per line
+LOW_STOCK_TMPL = "Item: {name}\nCategory: {cat}\nCurrent Stock: {qty}\nMinimum Stock: {min_stock}\n" + "-" * 30
+ITEM_TMPL = ("Item: {name}\nCategory: {cat}\nQuantity: {qty}\nPrice: ${price:.2f}\n"
+             "Total Value: ${value:.2f}\nSupplier: {sup}\n" + "-" * 30)
+CATEGORY_TMPL = "Category: {name}\nNumber of Items: {count}\nTotal Value: ${value:.2f}\n" + "-" * 30
+
+# Dashboard aggregates fetched in one round trip
+@dataclass
+class DashboardSnapshot:
+    total_items: int = 0
+    total_categories: int = 0
+    low_stock_items: list = field(default_factory=list)
+    recent_items: list = field(default_factory=list)
+    top_stock: list = field(default_factory=list)
+
 # Database Manager
 class DatabaseManager:
+    READ_POOL_SIZE = 4
+
     def __init__(self, db_name="inventory.db"):
         self.db_name = db_name
+        # Re-entrant so nested writer() blocks join the outermost transaction
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        # Set when a nested writer() block fails; the outermost block then rolls back
+        self._rollback_only = False
+        # Bumped on every committed write; cached reads are valid while it is unchanged
+        self._version = 0
+        self._snapshot_cache = None
+        self._query_cache = {}
+        self._query_cache_version = 0
+        # One long-lived write connection plus a bounded pool of read-only ones
+        self.conn = self._connect()
         self.init_database()
+        self._readers = queue.Queue(maxsize=self.READ_POOL_SIZE)
+        for _ in range(self.READ_POOL_SIZE):
+            self._readers.put(self._connect(read_only=True))
+
+    def _connect(self, read_only=False):
+        """Open a connection with the shared performance PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_name, check_same_thread=False, isolation_level=None)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+        """)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
      
     def init_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
          
         # Users table
         cursor.execute('''CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY, username TEXT UNIQUE, password TEXT, role TEXT)''')
+            id INTEGER PRIMARY KEY, username TEXT UNIQUE, password TEXT, role TEXT, salt BLOB)''')
+        user_columns = [row[1] for row in cursor.execute("PRAGMA table_info(users)")]
+        if 'salt' not in user_columns:
+            cursor.execute("ALTER TABLE users ADD COLUMN salt BLOB")
          
         # Categories table
         cursor.execute('''CREATE TABLE IF NOT EXISTS categories (
@@ -39,27 +152,164 @@ class DatabaseManager:
             price REAL, min_stock INTEGER, supplier TEXT, date_added TEXT,
             FOREIGN KEY (category_id) REFERENCES categories (id))''')
          
-        # Add default admin user
-        cursor.execute("INSERT OR IGNORE INTO users VALUES (1, 'admin', ?, 'admin')", 
-                      (hashlib.sha256('admin'.encode()).hexdigest(),))
-         
-        conn.commit()
-        conn.close()
+        # Indexes for the dashboard, items tab and report predicates
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_date_added ON items (date_added DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_category_id ON items (category_id)")
+        cursor.execute('''CREATE INDEX IF NOT EXISTS idx_items_low_stock ON items (quantity, min_stock)
+            WHERE quantity <= min_stock''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_name ON items (name)")
+         
+        # Add default admin user; only pay for the PBKDF2 hash when the row is missing
+        if cursor.execute("SELECT 1 FROM users WHERE id=1").fetchone() is None:
+            salt = secrets.token_bytes(16)
+            cursor.execute("INSERT OR IGNORE INTO users (id, username, password, role, salt) VALUES (1, 'admin', ?, 'admin', ?)", 
+                          (hash_password('admin', salt), salt))
+         
+        cursor.execute("COMMIT")
+        cursor.execute("ANALYZE")
+
+    def acquire(self):
+        """Take a read connection from the pool, blocking until one is free"""
+        return self._readers.get()
+
+    def release(self, conn):
+        """Return a read connection to the pool"""
+        self._readers.put(conn)
+
+    @contextmanager
+    def reader(self):
+        """Yield a cursor on a pooled read-only connection"""
+        conn = self.acquire()
+        try:
+            yield conn.cursor()
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def writer(self):
+        """Yield a cursor on the write connection inside a transaction"""
+        # Nested uses share the outermost transaction, so a loop of single-row
+        # writes wrapped in writer() commits once
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            outermost = self._write_depth == 0
+            if outermost:
+                cursor.execute("BEGIN IMMEDIATE")
+            self._write_depth += 1
+            try:
+                yield cursor
+            except Exception:
+                if outermost:
+                    self._rollback_only = False
+                    cursor.execute("ROLLBACK")
+                else:
+                    # execute_query swallows the error, so remember it for the outermost block
+                    self._rollback_only = True
+                raise
+            finally:
+                self._write_depth -= 1
+            if outermost:
+                if self._rollback_only:
+                    self._rollback_only = False
+                    cursor.execute("ROLLBACK")
+                    raise sqlite3.DatabaseError("a nested write failed; transaction rolled back")
+                cursor.execute("COMMIT")
+                self._version += 1
+
     def execute_query(self, query, params=(), fetch=False):
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
+            is_read = query.lstrip().upper().startswith("SELECT")
+            with (self.reader() if is_read else self.writer()) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall() if fetch else True
+        except Exception as e:
+            print(f"Database error: {e}")
+            return None
+
+    def executemany(self, query, seq_of_params):
+        """Run one statement for many parameter sets inside a single transaction"""
+        try:
+            with self.writer() as cursor:
+                cursor.executemany(query, seq_of_params)
+                return True
+        except Exception as e:
+            print(f"Database error: {e}")
+            return None
+
+    def add_items_bulk(self, rows):
+        """Insert (name, category_id, quantity, price, min_stock, supplier, date_added) rows in one transaction"""
+        success = self.executemany(Q_INSERT_ITEM, rows)
+        with self._write_lock:
+            # Refresh planner statistics once the outermost transaction has committed
+            if success and self._write_depth == 0:
+                self.conn.execute("ANALYZE")
+        return success
+
+    def stream(self, query, params=(), chunk_size=10_000):
+        """Yield the rows of a SELECT in lists of at most chunk_size rows"""
+        with self.reader() as cursor:
             cursor.execute(query, params)
-            result = cursor.fetchall() if fetch else None
-            conn.commit()
-            return result
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+
+    def invalidate(self):
+        """Drop every cached result, e.g. to pick up writes made by another process"""
+        with self._write_lock:
+            self._version += 1
+            self._query_cache = {}
+            self._snapshot_cache = None
+
+    def cached_query(self, query, params=()):
+        """Run a SELECT, reusing the previous rows if nothing was written since"""
+        key = (query, tuple(params))
+        version = self._version
+        if self._query_cache_version != version:
+            # A write invalidated every entry; drop them rather than keep stale rows around
+            self._query_cache = {}
+            self._query_cache_version = version
+        if key in self._query_cache:
+            return self._query_cache[key]
+        rows = self.execute_query(query, params, fetch=True)
+        if rows is not None and self._version == version:  # skip rows a concurrent write made stale
+            self._query_cache[key] = rows
+        return rows
+
+    def dashboard_snapshot(self):
+        """Fetch every dashboard aggregate on one cursor in a single read transaction"""
+        version = self._version
+        if self._snapshot_cache and self._snapshot_cache[0] == version:
+            return self._snapshot_cache[1]
+        try:
+            with self.reader() as cursor:
+                cursor.execute("BEGIN")
+                try:
+                    total_items, total_categories = cursor.execute(Q_COUNTS).fetchone()
+                    snapshot = DashboardSnapshot(
+                        total_items=total_items,
+                        total_categories=total_categories,
+                        low_stock_items=cursor.execute(Q_LOW_STOCK).fetchall(),
+                        recent_items=cursor.execute(Q_RECENT).fetchall(),
+                        top_stock=cursor.execute(Q_TOP_STOCK).fetchall(),
+                    )
+                finally:
+                    cursor.execute("COMMIT")
+            self._snapshot_cache = (version, snapshot)
+            return snapshot
         except Exception as e:
             print(f"Database error: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()  # Always close connection
+
+    def close(self):
+        """Close the write connection and every pooled read connection"""
+        with self._write_lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
  
 # Login Dialog
 class LoginDialog(QDialog):
@@ -67,6 +317,8 @@ class LoginDialog(QDialog):
         super().__init__()
         self.db_manager = db_manager
         self.user_role = None
+        # username -> (password, salt, role) rows already fetched by this dialog
+        self._user_records = {}
         self.setup_ui()
      
     def setup_ui(self):
@@ -145,17 +397,42 @@ class LoginDialog(QDialog):
      
     def login(self):
         username = self.username.text()
-        password = hashlib.sha256(self.password.text().encode()).hexdigest()
-         
-        result = self.db_manager.execute_query(
-            "SELECT role FROM users WHERE username=? AND password=?", 
-            (username, password), fetch=True)
-         
-        if result:
-            self.user_role = result[0][0]
+        password = self.password.text()
+         
+        record = self._user_records.get(username)
+        if record is None:
+            result = self.db_manager.execute_query(
+                "SELECT password, salt, role FROM users WHERE username=?", 
+                (username,), fetch=True)
+            if result:
+                record = self._user_records[username] = result[0]
+         
+        if record and self.verify_password(username, password, *record[:2]):
+            self.user_role = record[2]
             self.accept()
         else:
             QMessageBox.warning(self, "Error", "Invalid credentials!")
+
+    def verify_password(self, username, password, stored_hash, salt):
+        """Check a password, upgrading legacy unsalted SHA-256 hashes on success"""
+        if salt is not None:
+            return hmac.compare_digest(_pw_digest(password, salt), stored_hash)
+         
+        legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+        if not hmac.compare_digest(legacy_hash, stored_hash):
+            return False
+        salt = secrets.token_bytes(16)
+        self.db_manager.execute_query(
+            "UPDATE users SET password=?, salt=? WHERE username=?",
+            (hash_password(password, salt), salt, username))
+        self._user_records.pop(username, None)
+        return True
+
+    def done(self, result):
+        # Don't keep password digests in memory once the dialog closes
+        _pw_digest.cache_clear()
+        self._user_records.clear()
+        super().done(result)
  
 # Chart Widget
 class ChartWidget(FigureCanvas):
@@ -167,11 +444,44 @@ class ChartWidget(FigureCanvas):
         self.bars = None
         self.annot = None
         self.anim = None # To keep a reference to the animation
+        self._labels = None
         self.mpl_connect('motion_notify_event', self.hover)
 
+    def stop_animation(self):
+        """Stop any running animation and drop it so its timer and frames can be freed"""
+        if self.anim is not None:
+            if self.anim.event_source is not None:
+                self.anim.event_source.stop()
+            self.anim = None
+
+    @staticmethod
+    def _bar_colors(quantities):
+        # Bucket quantities into red (<10), orange (<20) and green without a per-bar branch
+        q = np.fromiter(quantities, dtype=np.int64)
+        idx = (q >= 10).astype(np.int8) + (q >= 20).astype(np.int8)
+        return np.array(['#f44336', '#ff9800', '#4CAF50'])[idx]
+
+    def update_stock_levels(self, data):
+        """Move the existing bars to new heights, replotting only if the items changed"""
+        if not data or self.bars is None or self._labels != [name for name, _ in data]:
+            self.plot_stock_levels(data)
+            return
+
+        self.stop_animation()
+        quantities = [quantity for _, quantity in data]
+        for bar, height, color in zip(self.bars, quantities, self._bar_colors(quantities)):
+            bar.set_animated(False)
+            bar.set_height(height)
+            bar.set_color(color)
+        self.ax.set_ylim(0, max(quantities) * 1.15 or 10)
+        self.draw_idle()
+
     def plot_stock_levels(self, data):
+        self.stop_animation()
         self.figure.clear()
         self.ax = self.figure.add_subplot(111)
+        self.bars = None
+        self._labels = None
 
         if not data:
             self.ax.text(0.5, 0.5, 'No data to display', ha='center', va='center')
@@ -179,7 +489,8 @@ class ChartWidget(FigureCanvas):
             return
 
         items, quantities = zip(*data)
-        colors = ['#f44336' if q < 10 else '#ff9800' if q < 20 else '#4CAF50' for q in quantities]
+        self._labels = list(items)
+        colors = self._bar_colors(quantities)
 
         # Initial plot with heights of 0 for animation
         self.bars = self.ax.bar(range(len(items)), [0] * len(quantities), color=colors)
@@ -207,21 +518,32 @@ class ChartWidget(FigureCanvas):
 
         self.figure.tight_layout(pad=2.0)
 
+        # Bars are redrawn over a cached background instead of re-rendering the axes
+        for bar in self.bars:
+            bar.set_animated(True)
+
+        # Precompute every frame's heights with an ease-in curve: one row per frame
+        self._heights = (np.linspace(0, 1, 100) ** 2)[:, None] * np.asarray(quantities)[None, :]
+
         def animate(frame):
-            for i, bar in enumerate(self.bars):
-                target_height = quantities[i]
-                # Simple easing function
-                progress = frame / 100.0
-                ease_progress = progress * progress # ease-in
-                current_height = target_height * ease_progress
-                bar.set_height(current_height)
+            for bar, height in zip(self.bars, self._heights[frame]):
+                bar.set_height(height)
+            if frame == 99:
+                # Hand the bars back to normal drawing so hover redraws include them
+                for bar in self.bars:
+                    bar.set_animated(False)
             return self.bars
 
         # Create and store the animation
-        self.anim = FuncAnimation(self.figure, animate, frames=100, interval=15, blit=False, repeat=False)
+        self.anim = FuncAnimation(self.figure, animate, frames=100, interval=15, blit=True, repeat=False,
+                                  cache_frame_data=False)
 
         self.draw()
 
+    def closeEvent(self, event):
+        self.stop_animation()
+        super().closeEvent(event)
+
     def hover(self, event):
         if not self.ax or not self.bars:
             return
@@ -248,6 +570,221 @@ class ChartWidget(FigureCanvas):
         self.annot.set_text(text)
         self.annot.get_bbox_patch().set_alpha(0.7)
  
+# Application themes
+_DARK_QSS = """
+    QWidget { background-color: #2d2d2d; color: #f5f5f5; font-family: 'Segoe UI'; }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit { 
+        padding: 8px; border: 2px solid #555; border-radius: 5px; 
+        background-color: #3d3d3d; color: #f5f5f5; font-size: 14px; }
+    QLineEdit:focus, QComboBox:focus { border-color: #4CAF50; }
+    QPushButton { 
+        padding: 10px 20px; background-color: #4CAF50; color: white; 
+        border: none; border-radius: 5px; font-size: 14px; font-weight: bold; }
+    QPushButton:hover { background-color: #45a049; }
+    QPushButton:pressed { background-color: #3d8b40; }
+    QTableView { 
+        gridline-color: #555; background-color: #3d3d3d; 
+        alternate-background-color: #4d4d4d; color: #f5f5f5; }
+    QTableView::item { padding: 8px; }
+    QTableView::item:selected { background-color: #4CAF50; color: white; }
+    QHeaderView::section { 
+        background-color: #2196F3; color: white; padding: 10px; 
+        font-weight: bold; border: none; }
+    QTabWidget::pane { border: 1px solid #555; background-color: #3d3d3d; border-top-right-radius: 8px; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;}
+    QTabWidget > QTabBar {
+        alignment: center;
+    }
+    QTabBar::tab { 
+        background-color: #3d3d3d;
+        color: #f5f5f5;
+        padding: 12px 25px;
+        border: 1px solid #555;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        margin: 0 4px;
+    }
+    QTabBar::tab:hover {
+        background-color: #4d4d4d;
+    }
+    QTabBar::tab:selected { 
+        background-color: #4CAF50; 
+        color: white; 
+        border-bottom-color: #3d3d3d;
+    }
+    QGroupBox { 
+        font-weight: bold; border: 1px solid #555; border-radius: 10px; 
+        margin-top: 10px; padding: 10px; color: #f5f5f5; 
+        background-color: #3d3d3d;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+    }
+    QFrame {
+        border-radius: 15px;
+    }
+    QLabel { color: #f5f5f5; }
+    QListWidget { background-color: #3d3d3d; color: #f5f5f5; }
+    QDialog { background-color: #2d2d2d; }
+"""
+
+_LIGHT_QSS = """
+    QWidget { background-color: #f5f5f5; font-family: 'Segoe UI'; }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit { 
+        padding: 8px; border: 2px solid #ddd; border-radius: 5px; 
+        background-color: white; font-size: 14px; }
+    QLineEdit:focus, QComboBox:focus { border-color: #4CAF50; }
+    QPushButton { 
+        padding: 10px 20px; background-color: #4CAF50; color: white; 
+        border: none; border-radius: 5px; font-size: 14px; font-weight: bold; }
+    QPushButton:hover { background-color: #45a049; }
+    QPushButton:pressed { background-color: #3d8b40; }
+    QTableView { 
+        gridline-color: #ddd; background-color: white; 
+        alternate-background-color: #f9f9f9; }
+    QTableView::item { padding: 8px; }
+    QTableView::item:selected { background-color: #4CAF50; color: white; }
+    QHeaderView::section { 
+        background-color: #2196F3; color: white; padding: 10px; 
+        font-weight: bold; border: none; }
+    QTabWidget::pane { border: 1px solid #ddd; background-color: white; border-top-right-radius: 8px; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;}
+    QTabWidget > QTabBar {
+        alignment: center;
+    }
+    QTabBar::tab { 
+        background-color: #e0e0e0; 
+        color: #333;
+        padding: 12px 25px;
+        border: 1px solid #ddd;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        margin: 0 4px;
+    }
+    QTabBar::tab:hover {
+        background-color: #f0f0f0;
+    }
+    QTabBar::tab:selected { 
+        background-color: #4CAF50; 
+        color: white; 
+        border-bottom-color: #ffffff;
+    }
+    QGroupBox { 
+        font-weight: bold; border: 1px solid #ddd; border-radius: 10px; 
+        margin-top: 10px; padding: 10px;
+        background-color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+    }
+    QFrame {
+        border-radius: 15px;
+    }
+"""
+
+# Export Worker
+class ExportSignals(QObject):
+    done = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+class ExportWorker(QRunnable):
+    """Run an export job off the UI thread and report the outcome through signals"""
+    def __init__(self, job, success_message, error_prefix):
+        super().__init__()
+        self.job = job
+        self.success_message = success_message
+        self.error_prefix = error_prefix
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            self.job()
+        except Exception as e:
+            self.signals.error.emit(f"{self.error_prefix}: {str(e)}")
+        else:
+            self.signals.done.emit(self.success_message)
+ 
+# Items Table Model
+class ItemsTableModel(QAbstractTableModel):
+    HEADERS = ["ID", "Name", "Category", "Quantity", "Price", "Min Stock", "Supplier", "Date Added"]
+    _LOW_STOCK_BRUSH = QBrush(QColor(255, 200, 200))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        # Display strings computed once per load; the view and the search
+        # filter read these on every paint and keystroke
+        self._display_rows = []
+
+    def set_rows(self, rows):
+        """Replace all rows, signalling only the rows that changed instead of a full reset"""
+        rows = list(rows)
+        display_rows = [tuple(str(value or "") for value in row) for row in rows]
+        old_n, new_n = len(self.rows), len(rows)
+        shared = min(old_n, new_n)
+         
+        # A different item at any shared position (e.g. a category switch) means the
+        # view's selection would point at the wrong item, so fall back to a reset
+        if any(self.rows[r][0] != rows[r][0] for r in range(shared)):
+            self.beginResetModel()
+            self.rows = rows
+            self._display_rows = display_rows
+            self.endResetModel()
+            return
+         
+        # Same items at the shared positions: update them in place, with one
+        # dataChanged covering the changed span
+        changed = [r for r in range(shared) if self.rows[r] != rows[r]]
+        self.rows[:shared] = rows[:shared]
+        self._display_rows[:shared] = display_rows[:shared]
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 0),
+                                  self.index(changed[-1], len(self.HEADERS) - 1))
+         
+        # Only the tail is inserted or removed
+        if new_n > old_n:
+            self.beginInsertRows(QModelIndex(), old_n, new_n - 1)
+            self.rows.extend(rows[old_n:])
+            self._display_rows.extend(display_rows[old_n:])
+            self.endInsertRows()
+        elif new_n < old_n:
+            self.beginRemoveRows(QModelIndex(), new_n, old_n - 1)
+            del self.rows[new_n:]
+            del self._display_rows[new_n:]
+            self.endRemoveRows()
+
+    def remove_row(self, row):
+        """Drop a single row, e.g. after it was deleted from the database"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        del self._display_rows[row]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return self._display_rows[index.row()][col]
+        row = self.rows[index.row()]
+        # Highlight low stock items
+        if role == Qt.BackgroundRole and col == 3 and row[3] <= row[5]:  # quantity <= min_stock
+            return self._LOW_STOCK_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+ 
 # Main Application
 class InventoryApp(QMainWindow):
     def __init__(self):
@@ -263,31 +800,30 @@ class InventoryApp(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
          
         # Login first
-        login_dialog = LoginDialog(self.db_manager)
-        if login_dialog.exec_() == QDialog.Accepted:
-            self.current_user_role = login_dialog.user_role
-        else:
+        if not self.login():
             sys.exit()
          
-        # Central widget with tabs
+        # Central widget with tabs. Each tab starts as a placeholder and is
+        # built the first time it is shown.
         central_widget = QTabWidget()
         self.setCentralWidget(central_widget)
-         
-        # Dashboard tab
-        self.dashboard_widget = self.create_dashboard()
-        central_widget.addTab(self.dashboard_widget, "Dashboard")
-         
-        # Items management tab
-        self.items_widget = self.create_items_tab()
-        central_widget.addTab(self.items_widget, "Items")
-         
-        # Categories tab
-        self.categories_widget = self.create_categories_tab()
-        central_widget.addTab(self.categories_widget, "Categories")
-         
-        # Reports tab
-        self.reports_widget = self.create_reports_tab()
-        central_widget.addTab(self.reports_widget, "Reports")
+        self.chart_widget = None
+        self.items_table = None
+        self.categories_list = None
+        self.report_display = None
+        # Dashboard stat card values, kept current by deltas on each item/category write
+        self._dash = {'items': 0, 'low': 0, 'categories': 0}
+        self._cat_name_to_id = {}
+        self._tab_builders = [
+            (self.create_dashboard, "Dashboard"),
+            (self.create_items_tab, "Items"),
+            (self.create_categories_tab, "Categories"),
+            (self.create_reports_tab, "Reports"),
+        ]
+        self._built_tabs = set()
+        for _, title in self._tab_builders:
+            central_widget.addTab(QWidget(), title)
+        central_widget.currentChanged.connect(self._ensure_tab_built)
          
         # Toolbar
         self.create_toolbar()
@@ -295,124 +831,48 @@ class InventoryApp(QMainWindow):
         # Status bar
         self.statusBar().showMessage("Ready")
          
-        # Load initial data
-        self.load_categories()
+        # Build the first tab once the window is up instead of before showing it
+        QTimer.singleShot(0, lambda: self._ensure_tab_built(central_widget.currentIndex()))
+
+    def login(self):
+        """Show the login dialog; returns True once a user has signed in"""
+        login_dialog = LoginDialog(self.db_manager)
+        if login_dialog.exec_() == QDialog.Accepted:
+            self.current_user_role = login_dialog.user_role
+            return True
+        return False
+
+    def _ensure_tab_built(self, index):
+        """Replace a tab's placeholder with its real widget on first visit"""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        builder, title = self._tab_builders[index]
+        central_widget = self.centralWidget()
+        placeholder = central_widget.widget(index)
+        central_widget.blockSignals(True)
+        central_widget.removeTab(index)
+        central_widget.insertTab(index, builder(), title)
+        central_widget.setCurrentIndex(index)
+        central_widget.blockSignals(False)
+        placeholder.deleteLater()
+         
+        # Load initial data for the widgets that were just created
+        if builder == self.create_items_tab:
+            self.load_categories()
+            self.load_items()
+        elif builder == self.create_categories_tab:
+            # Only the new list; leave the Items tab's filter and form selection alone
+            self.load_categories_list()
 
     def apply_theme(self):
         app = QApplication.instance()
-        if self.dark_theme:
-            app.setStyleSheet("""
-                QWidget { background-color: #2d2d2d; color: #f5f5f5; font-family: 'Segoe UI'; }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit { 
-                    padding: 8px; border: 2px solid #555; border-radius: 5px; 
-                    background-color: #3d3d3d; color: #f5f5f5; font-size: 14px; }
-                QLineEdit:focus, QComboBox:focus { border-color: #4CAF50; }
-                QPushButton { 
-                    padding: 10px 20px; background-color: #4CAF50; color: white; 
-                    border: none; border-radius: 5px; font-size: 14px; font-weight: bold; }
-                QPushButton:hover { background-color: #45a049; }
-                QPushButton:pressed { background-color: #3d8b40; }
-                QTableWidget { 
-                    gridline-color: #555; background-color: #3d3d3d; 
-                    alternate-background-color: #4d4d4d; color: #f5f5f5; }
-                QTableWidget::item { padding: 8px; }
-                QTableWidget::item:selected { background-color: #4CAF50; color: white; }
-                QHeaderView::section { 
-                    background-color: #2196F3; color: white; padding: 10px; 
-                    font-weight: bold; border: none; }
-                QTabWidget::pane { border: 1px solid #555; background-color: #3d3d3d; border-top-right-radius: 8px; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;}
-                QTabWidget > QTabBar {
-                    alignment: center;
-                }
-                QTabBar::tab { 
-                    background-color: #3d3d3d;
-                    color: #f5f5f5;
-                    padding: 12px 25px;
-                    border: 1px solid #555;
-                    border-top-left-radius: 8px;
-                    border-top-right-radius: 8px;
-                    margin: 0 4px;
-                }
-                QTabBar::tab:hover {
-                    background-color: #4d4d4d;
-                }
-                QTabBar::tab:selected { 
-                    background-color: #4CAF50; 
-                    color: white; 
-                    border-bottom-color: #3d3d3d;
-                }
-                QGroupBox { 
-                    font-weight: bold; border: 1px solid #555; border-radius: 10px; 
-                    margin-top: 10px; padding: 10px; color: #f5f5f5; 
-                    background-color: #3d3d3d;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    subcontrol-position: top left;
-                    padding: 0 5px;
-                }
-                QFrame {
-                    border-radius: 15px;
-                }
-                QLabel { color: #f5f5f5; }
-                QListWidget { background-color: #3d3d3d; color: #f5f5f5; }
-                QDialog { background-color: #2d2d2d; }
-            """)
-        else:
-            app.setStyleSheet("""
-                QWidget { background-color: #f5f5f5; font-family: 'Segoe UI'; }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit { 
-                    padding: 8px; border: 2px solid #ddd; border-radius: 5px; 
-                    background-color: white; font-size: 14px; }
-                QLineEdit:focus, QComboBox:focus { border-color: #4CAF50; }
-                QPushButton { 
-                    padding: 10px 20px; background-color: #4CAF50; color: white; 
-                    border: none; border-radius: 5px; font-size: 14px; font-weight: bold; }
-                QPushButton:hover { background-color: #45a049; }
-                QPushButton:pressed { background-color: #3d8b40; }
-                QTableWidget { 
-                    gridline-color: #ddd; background-color: white; 
-                    alternate-background-color: #f9f9f9; }
-                QTableWidget::item { padding: 8px; }
-                QTableWidget::item:selected { background-color: #4CAF50; color: white; }
-                QHeaderView::section { 
-                    background-color: #2196F3; color: white; padding: 10px; 
-                    font-weight: bold; border: none; }
-                QTabWidget::pane { border: 1px solid #ddd; background-color: white; border-top-right-radius: 8px; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;}
-                QTabWidget > QTabBar {
-                    alignment: center;
-                }
-                QTabBar::tab { 
-                    background-color: #e0e0e0; 
-                    color: #333;
-                    padding: 12px 25px;
-                    border: 1px solid #ddd;
-                    border-top-left-radius: 8px;
-                    border-top-right-radius: 8px;
-                    margin: 0 4px;
-                }
-                QTabBar::tab:hover {
-                    background-color: #f0f0f0;
-                }
-                QTabBar::tab:selected { 
-                    background-color: #4CAF50; 
-                    color: white; 
-                    border-bottom-color: #ffffff;
-                }
-                QGroupBox { 
-                    font-weight: bold; border: 1px solid #ddd; border-radius: 10px; 
-                    margin-top: 10px; padding: 10px;
-                    background-color: #ffffff;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    subcontrol-position: top left;
-                    padding: 0 5px;
-                }
-                QFrame {
-                    border-radius: 15px;
-                }
-            """)
+        target = _DARK_QSS if self.dark_theme else _LIGHT_QSS
+        if app.styleSheet() == target:
+            return
+        self.setUpdatesEnabled(False)
+        app.setStyleSheet(target)
+        self.setUpdatesEnabled(True)
 
     def toggle_theme(self):
         self.dark_theme = not self.dark_theme
@@ -462,35 +922,23 @@ class InventoryApp(QMainWindow):
         layout = QGridLayout()
         layout.setSpacing(20)
 
-        # Fetch data
-        total_items = len(self.db_manager.execute_query("SELECT * FROM items", fetch=True) or [])
-        low_stock_items = self.db_manager.execute_query(
-            "SELECT name, quantity FROM items WHERE quantity <= min_stock", fetch=True) or []
-        low_stock_count = len(low_stock_items)
-        total_categories = len(self.db_manager.execute_query("SELECT * FROM categories", fetch=True) or [])
-        recent_items = self.db_manager.execute_query(
-            "SELECT name, date_added FROM items ORDER BY date_added DESC LIMIT 5", fetch=True) or []
-
         # --- Bento Grid Items ---
+        # Widgets are kept on self and filled in place by update_dashboard
 
         # 1. Total Items Card (Large)
-        total_card = self.create_stat_card("Total Items", str(total_items), "#2196F3", "📦")
+        total_card, self._stat_total_items = self.create_stat_card("Total Items", "0", "#2196F3", "📦")
         layout.addWidget(total_card, 0, 0, 2, 2)  # Spans 2 rows, 2 columns
 
         # 2. Low Stock Card
-        low_stock_card = self.create_stat_card("Low Stock", str(low_stock_count), "#f44336", "⚠️")
+        low_stock_card, self._stat_low_stock = self.create_stat_card("Low Stock", "0", "#f44336", "⚠️")
         layout.addWidget(low_stock_card, 0, 2, 1, 1)
 
         # 3. Categories Card
-        categories_card = self.create_stat_card("Categories", str(total_categories), "#4CAF50", "🏷️")
+        categories_card, self._stat_categories = self.create_stat_card("Categories", "0", "#4CAF50", "🏷️")
         layout.addWidget(categories_card, 1, 2, 1, 1)
 
         # 4. Stock Level Chart (Large)
         self.chart_widget = ChartWidget()
-        items_data = self.db_manager.execute_query(
-            "SELECT name, quantity FROM items ORDER BY quantity DESC LIMIT 10", fetch=True)
-        if items_data:
-            self.chart_widget.plot_stock_levels(items_data)
         chart_container = QGroupBox("Stock Levels")
         chart_layout = QVBoxLayout()
         chart_layout.addWidget(self.chart_widget)
@@ -498,36 +946,29 @@ class InventoryApp(QMainWindow):
         layout.addWidget(chart_container, 2, 0, 2, 3)
 
         # 5. Low Stock Items List
-        low_stock_list = QListWidget()
-        if low_stock_items:
-            for name, qty in low_stock_items:
-                low_stock_list.addItem(f"{name} (Qty: {qty})")
-        else:
-            low_stock_list.addItem("No low stock items.")
+        self._low_stock_list = QListWidget()
         low_stock_group = QGroupBox("Low Stock Items")
         low_stock_layout = QVBoxLayout()
-        low_stock_layout.addWidget(low_stock_list)
+        low_stock_layout.addWidget(self._low_stock_list)
         low_stock_group.setLayout(low_stock_layout)
         layout.addWidget(low_stock_group, 0, 3, 2, 1)
 
         # 6. Recently Added Items
-        recent_items_list = QListWidget()
-        if recent_items:
-            for name, date_added in recent_items:
-                recent_items_list.addItem(f"{name} ({date_added.split(' ')[0]})")
-        else:
-            recent_items_list.addItem("No recent items.")
+        self._recent_items_list = QListWidget()
         recent_items_group = QGroupBox("Recently Added")
         recent_items_layout = QVBoxLayout()
-        recent_items_layout.addWidget(recent_items_list)
+        recent_items_layout.addWidget(self._recent_items_list)
         recent_items_group.setLayout(recent_items_layout)
         layout.addWidget(recent_items_group, 2, 3, 2, 1)
 
+        self._dashboard_snapshot = None
+        self.update_dashboard()
+
         widget.setLayout(layout)
         return widget
      
     def create_stat_card(self, title, value, color, icon):
-        """Create a modern, interactive statistics card"""
+        """Create a modern, interactive statistics card; returns the card and its value label"""
         card = QFrame()
         card.setFrameShape(QFrame.StyledPanel)
         card.setFrameShadow(QFrame.Raised)
@@ -563,7 +1004,7 @@ class InventoryApp(QMainWindow):
         layout.addStretch()
         
         card.setLayout(layout)
-        return card
+        return card, value_label
      
     def create_items_tab(self):
         """Create items management tab"""
@@ -572,13 +1013,22 @@ class InventoryApp(QMainWindow):
          
         # Search and filter
         search_layout = QHBoxLayout()
+        # Coalesce bursts of filter changes into one filter_items call
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.filter_items)
+         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search items...")
-        self.search_input.textChanged.connect(self.filter_items)
+        self.search_input.textChanged.connect(self._filter_timer.start)
          
         self.category_filter = QComboBox()
         self.category_filter.addItem("All Categories")
-        self.category_filter.currentTextChanged.connect(self.filter_items)
+        # Not connected to start directly: the int index would bind to start(msec)
+        self.category_filter.currentIndexChanged.connect(lambda: self._filter_timer.start())
+        self._items_category_id = None
+        self._search_text = ""
          
         search_layout.addWidget(QLabel("Search:"))
         search_layout.addWidget(self.search_input)
@@ -586,11 +1036,14 @@ class InventoryApp(QMainWindow):
         search_layout.addWidget(self.category_filter)
          
         # Items table
-        self.items_table = QTableWidget()
-        self.items_table.setColumnCount(8)
-        self.items_table.setHorizontalHeaderLabels([
-            "ID", "Name", "Category", "Quantity", "Price", "Min Stock", "Supplier", "Date Added"
-        ])
+        self.items_model = ItemsTableModel(self)
+        # Name search is done by the proxy in C++ rather than a Python loop over rows
+        self.items_proxy = QSortFilterProxyModel(self)
+        self.items_proxy.setSourceModel(self.items_model)
+        self.items_proxy.setFilterKeyColumn(1)
+        self.items_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.items_table = QTableView()
+        self.items_table.setModel(self.items_proxy)
         self.items_table.horizontalHeader().setStretchLastSection(True)
         self.items_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.items_table.setAlternatingRowColors(True)
@@ -717,84 +1170,136 @@ class InventoryApp(QMainWindow):
      
     def refresh_all_data(self):
         """Refresh all data in the application"""
+        # The caches only track this process's writes; re-query for external ones
+        self.db_manager.invalidate()
         self.load_items()
         self.load_categories()
         self.update_dashboard()
         self.statusBar().showMessage("Data refreshed", 2000)
      
     def load_items(self):
-        """Load items into the table"""
-        items = self.db_manager.execute_query("""
-            SELECT i.id, i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.date_added
-            FROM items i LEFT JOIN categories c ON i.category_id = c.id
-        """, fetch=True)
+        """Load items for the selected category into the table"""
+        if self.items_table is None:
+            return
+        category_id = self.category_filter.currentData()
+        if category_id:
+            items = self.db_manager.cached_query(Q_LOAD_ITEMS_BY_CATEGORY, (category_id,))
+        else:
+            items = self.db_manager.cached_query(Q_LOAD_ITEMS)
          
-        self.items_table.setRowCount(len(items) if items else 0)
+        self._items_category_id = category_id
          
-        if items:
-            for row, item in enumerate(items):
-                for col, value in enumerate(item):
-                    self.items_table.setItem(row, col, QTableWidgetItem(str(value or "")))
-                     
-                    # Highlight low stock items
-                    if col == 3 and item[3] <= item[5]:  # quantity <= min_stock
-                        self.items_table.item(row, col).setBackground(QColor(255, 200, 200))
+        # Repaint and re-sort once after the update, not per row
+        table = self.items_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            self.items_model.set_rows(items or [])
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
      
     def load_categories(self):
         """Load categories into dropdowns and lists"""
-        categories = self.db_manager.execute_query("SELECT id, name FROM categories", fetch=True)
-         
-        # Update category dropdown in items form
-        self.item_category.clear()
-        self.item_category.addItem("Select Category", 0)
-         
-        # Update category filter
-        self.category_filter.clear()
-        self.category_filter.addItem("All Categories")
-         
-        # Update categories list
-        self.categories_list.clear()
+        categories = self.db_manager.cached_query(Q_LOAD_CATEGORIES) or []
+        # Name -> id lookup for the item form; category names are unique
+        self._cat_name_to_id = {cat_name: cat_id for cat_id, cat_name in categories}
+         
+        if self.items_table is not None:
+            # Repopulate without a change signal per added entry
+            self.item_category.blockSignals(True)
+            self.category_filter.blockSignals(True)
+             
+            # Update category dropdown in items form
+            self.item_category.clear()
+            self.item_category.addItems(["Select Category"] + list(self._cat_name_to_id))
+             
+            # Update category filter
+            self.category_filter.clear()
+            self.category_filter.addItem("All Categories")
+             
+            for cat_id, cat_name in categories:
+                self.category_filter.addItem(cat_name, cat_id)
+             
+            self.item_category.blockSignals(False)
+            self.category_filter.blockSignals(False)
+            # The filter was reset to "All Categories"; refilter once
+            self._filter_timer.start()
          
-        if categories:
+        self.load_categories_list()
+     
+    def load_categories_list(self):
+        """Load categories into the Categories tab list"""
+        if self.categories_list is not None:
+            categories = self.db_manager.cached_query(Q_LOAD_CATEGORIES) or []
+            # Update categories list
+            self.categories_list.setUpdatesEnabled(False)
+            self.categories_list.clear()
+             
             for cat_id, cat_name in categories:
-                self.item_category.addItem(cat_name, cat_id)
-                self.category_filter.addItem(cat_name)
-                 
                 list_item = QListWidgetItem(cat_name)
                 list_item.setData(Qt.UserRole, cat_id)
                 self.categories_list.addItem(list_item)
+            self.categories_list.setUpdatesEnabled(True)
      
     def update_dashboard(self):
         """Update dashboard statistics and chart"""
-        # Recreate the entire dashboard to refresh all data
-        dashboard_widget = self.create_dashboard()
-        central_widget = self.centralWidget()
-        if central_widget and central_widget.count() > 0:
-            central_widget.removeTab(0)
-            central_widget.insertTab(0, dashboard_widget, "Dashboard")
-            central_widget.setCurrentIndex(0)
+        if self.chart_widget is None:
+            return  # Not built yet; it will load fresh data when first opened
+        snapshot = self.db_manager.dashboard_snapshot() or DashboardSnapshot()
+        if snapshot is self._dashboard_snapshot:
+            return  # Cached snapshot already on screen; nothing was written since
+        self._dashboard_snapshot = snapshot
+         
+        # Refresh the existing widgets in place instead of rebuilding the tab
+        self._dash = {
+            'items': snapshot.total_items,
+            'low': len(snapshot.low_stock_items),
+            'categories': snapshot.total_categories,
+        }
+        self.show_dashboard_stats()
+        self.chart_widget.update_stock_levels(snapshot.top_stock)
+         
+        self._low_stock_list.clear()
+        if snapshot.low_stock_items:
+            for name, qty in snapshot.low_stock_items:
+                self._low_stock_list.addItem(f"{name} (Qty: {qty})")
+        else:
+            self._low_stock_list.addItem("No low stock items.")
+         
+        self._recent_items_list.clear()
+        if snapshot.recent_items:
+            for name, date_added in snapshot.recent_items:
+                self._recent_items_list.addItem(f"{name} ({date_added.split(' ')[0]})")
+        else:
+            self._recent_items_list.addItem("No recent items.")
+     
+    def show_dashboard_stats(self):
+        """Show the cached stat card values without querying the database"""
+        if self.chart_widget is None:
+            return
+        self._stat_total_items.setText(str(self._dash['items']))
+        self._stat_low_stock.setText(str(self._dash['low']))
+        self._stat_categories.setText(str(self._dash['categories']))
      
     def filter_items(self):
         """Filter items based on search and category"""
-        search_text = self.search_input.text().lower()
-        category_text = self.category_filter.currentText()
+        # The category filter is applied in SQL on the indexed category_id
+        if self.category_filter.currentData() != self._items_category_id:
+            self.load_items()
          
-        for row in range(self.items_table.rowCount()):
-            show_row = True
-             
-            # Check search text
-            if search_text:
-                item_name = self.items_table.item(row, 1).text().lower()
-                if search_text not in item_name:
-                    show_row = False
-             
-            # Check category filter
-            if category_text != "All Categories":
-                item_category = self.items_table.item(row, 2).text()
-                if category_text != item_category:
-                    show_row = False
-             
-            self.items_table.setRowHidden(row, not show_row)
+        search_text = self.search_input.text()
+        if search_text == self._search_text:
+            return  # Same filter already applied; don't make the proxy refilter
+        self._search_text = search_text
+         
+        self.items_table.setUpdatesEnabled(False)
+        try:
+            self.items_proxy.setFilterFixedString(search_text)
+        finally:
+            self.items_table.setUpdatesEnabled(True)
      
     def add_item(self):
         """Add new item to inventory"""
@@ -802,15 +1307,12 @@ class InventoryApp(QMainWindow):
             QMessageBox.warning(self, "Error", "Item name is required!")
             return
          
-        category_id = self.item_category.currentData()
+        category_id = self._cat_name_to_id.get(self.item_category.currentText())
         if not category_id:
             QMessageBox.warning(self, "Error", "Please select a category!")
             return
          
-        success = self.db_manager.execute_query("""
-            INSERT INTO items (name, category_id, quantity, price, min_stock, supplier, date_added)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        success = self.db_manager.execute_query(Q_INSERT_ITEM, (
             self.item_name.text(),
             category_id,
             self.item_quantity.value(),
@@ -820,19 +1322,25 @@ class InventoryApp(QMainWindow):
             datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         ))
          
+        if success is not None:
+            self._dash['items'] += 1
+            if self.item_quantity.value() <= self.item_min_stock.value():
+                self._dash['low'] += 1
+            self.show_dashboard_stats()
+         
         self.clear_item_form()
         QMessageBox.information(self, "Success", "Item added successfully!")
         self.load_items()  # Move after dialog
      
     def update_item(self):
         """Update selected item"""
-        current_row = self.items_table.currentRow()
+        current_row = self.items_proxy.mapToSource(self.items_table.currentIndex()).row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to update!")
             return
          
-        item_id = self.items_table.item(current_row, 0).text()
-        category_id = self.item_category.currentData()
+        item_id = self.items_model.rows[current_row][0]
+        category_id = self._cat_name_to_id.get(self.item_category.currentText())
          
         success = self.db_manager.execute_query("""
             UPDATE items SET name=?, category_id=?, quantity=?, price=?, min_stock=?, supplier=?
@@ -848,13 +1356,19 @@ class InventoryApp(QMainWindow):
         ))
          
         if success is not None:
+            old_row = self.items_model.rows[current_row]
+            was_low = old_row[3] <= old_row[5]
+            is_low = self.item_quantity.value() <= self.item_min_stock.value()
+            self._dash['low'] += is_low - was_low
+            self.show_dashboard_stats()
+             
             self.clear_item_form()
             self.load_items()
             QMessageBox.information(self, "Success", "Item updated successfully!")
      
     def delete_item(self):
         """Delete selected item"""
-        current_row = self.items_table.currentRow()
+        current_row = self.items_proxy.mapToSource(self.items_table.currentIndex()).row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to delete!")
             return
@@ -863,11 +1377,17 @@ class InventoryApp(QMainWindow):
                                    QMessageBox.Yes | QMessageBox.No)
          
         if reply == QMessageBox.Yes:
-            item_id = self.items_table.item(current_row, 0).text()
+            item_id = self.items_model.rows[current_row][0]
             success = self.db_manager.execute_query("DELETE FROM items WHERE id=?", (item_id,))
              
             if success is not None:
-                self.load_items()
+                old_row = self.items_model.rows[current_row]
+                self._dash['items'] -= 1
+                self._dash['low'] -= old_row[3] <= old_row[5]
+                self.show_dashboard_stats()
+                 
+                # Only this row changed; drop it instead of re-fetching the table
+                self.items_model.remove_row(current_row)
                 QMessageBox.information(self, "Success", "Item deleted successfully!")
      
     def clear_item_form(self):
@@ -891,6 +1411,8 @@ class InventoryApp(QMainWindow):
         )
          
         if success is not None:
+            self._dash['categories'] += 1
+            self.show_dashboard_stats()
             self.clear_category_form()
             self.load_categories()
             QMessageBox.information(self, "Success", "Category added successfully!")
@@ -928,8 +1450,36 @@ class InventoryApp(QMainWindow):
             success = self.db_manager.execute_query("DELETE FROM categories WHERE id=?", (cat_id,))
              
             if success is not None:
+                self._dash['categories'] -= 1
+                self.show_dashboard_stats()
                 self.clear_category_form()
-                self.load_categories()
+                 
+                # Remove just this category from the list and dropdowns instead of reloading them
+                cat_name = current_item.text()
+                self._cat_name_to_id.pop(cat_name, None)
+                self.categories_list.takeItem(self.categories_list.row(current_item))
+                if self.items_table is not None:
+                    form_index = self.item_category.findText(cat_name)
+                    self.item_category.blockSignals(True)
+                    if form_index == self.item_category.currentIndex():
+                        # Back to "Select Category" so the next add isn't filed under another category
+                        self.item_category.setCurrentIndex(0)
+                    self.item_category.removeItem(form_index)
+                    self.item_category.blockSignals(False)
+                     
+                    filter_index = self.category_filter.findData(cat_id)
+                    self.category_filter.blockSignals(True)
+                    if filter_index == self.category_filter.currentIndex():
+                        # Fall back to "All Categories" rather than the next category in the list
+                        self.category_filter.setCurrentIndex(0)
+                    self.category_filter.removeItem(filter_index)
+                    self.category_filter.blockSignals(False)
+                     
+                    # Items that used this category now show none; reload them if any are
+                    # listed or the filter changed, otherwise the table is unaffected
+                    if (self.category_filter.currentData() != self._items_category_id
+                            or any(row[2] == cat_name for row in self.items_model.rows)):
+                        self._filter_timer.start()
                 QMessageBox.information(self, "Success", "Category deleted successfully!")
      
     def clear_category_form(self):
@@ -949,101 +1499,71 @@ class InventoryApp(QMainWindow):
      
     def generate_low_stock_report(self):
         """Generate low stock report"""
-        items = self.db_manager.execute_query("""
-            SELECT i.name, c.name, i.quantity, i.min_stock
-            FROM items i LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.quantity <= i.min_stock
-            ORDER BY i.quantity ASC
-        """, fetch=True)
+        items = self.db_manager.execute_query(Q_LOW_STOCK_REPORT, fetch=True)
          
-        report = "LOW STOCK REPORT\n" + "="*50 + "\n\n"
+        # Collect the pieces and join once rather than growing a string with +=
+        parts = ["LOW STOCK REPORT", "=" * 50, ""]
          
         if items:
-            for name, category, quantity, min_stock in items:
-                report += f"Item: {name}\n"
-                report += f"Category: {category or 'N/A'}\n"
-                report += f"Current Stock: {quantity}\n"
-                report += f"Minimum Stock: {min_stock}\n"
-                report += "-" * 30 + "\n"
+            parts.extend(
+                LOW_STOCK_TMPL.format(name=name, cat=category or 'N/A', qty=quantity, min_stock=min_stock)
+                for name, category, quantity, min_stock in items)
         else:
-            report += "No items are currently low in stock.\n"
+            parts.append("No items are currently low in stock.")
          
-        self.report_display.setText(report)
+        self.report_display.setText("\n".join(parts) + "\n")
      
     def generate_inventory_report(self):
         """Generate full inventory report"""
-        items = self.db_manager.execute_query("""
-            SELECT i.name, c.name, i.quantity, i.price, i.supplier
-            FROM items i LEFT JOIN categories c ON i.category_id = c.id
-            ORDER BY i.name
-        """, fetch=True)
+        items = self.db_manager.execute_query(Q_INVENTORY_REPORT, fetch=True)
          
-        report = "FULL INVENTORY REPORT\n" + "="*50 + "\n\n"
-        total_value = 0
+        parts = ["FULL INVENTORY REPORT", "=" * 50, ""]
          
         if items:
-            for name, category, quantity, price, supplier in items:
-                value = quantity * price
-                total_value += value
-                 
-                report += f"Item: {name}\n"
-                report += f"Category: {category or 'N/A'}\n"
-                report += f"Quantity: {quantity}\n"
-                report += f"Price: ${price:.2f}\n"
-                report += f"Total Value: ${value:.2f}\n"
-                report += f"Supplier: {supplier or 'N/A'}\n"
-                report += "-" * 30 + "\n"
+            parts.extend(
+                ITEM_TMPL.format(name=name, cat=category or 'N/A', qty=quantity, price=price,
+                                 value=value, sup=supplier or 'N/A')
+                for name, category, quantity, price, supplier, value, _ in items)
              
-            report += f"\nTOTAL INVENTORY VALUE: ${total_value:.2f}\n"
+            # Every row carries the window-function grand total computed by SQLite
+            total_value = items[0][6]
+            parts.append("")
+            parts.append(f"TOTAL INVENTORY VALUE: ${total_value:.2f}")
         else:
-            report += "No items in inventory.\n"
+            parts.append("No items in inventory.")
          
-        self.report_display.setText(report)
+        self.report_display.setText("\n".join(parts) + "\n")
      
     def generate_category_report(self):
         """Generate category-wise report"""
-        categories = self.db_manager.execute_query("""
-            SELECT c.name, COUNT(i.id) as item_count, SUM(i.quantity * i.price) as total_value
-            FROM categories c LEFT JOIN items i ON c.id = i.category_id
-            GROUP BY c.id, c.name
-            ORDER BY total_value DESC
-        """, fetch=True)
+        categories = self.db_manager.execute_query(Q_CATEGORY_REPORT, fetch=True)
          
-        report = "CATEGORY REPORT\n" + "="*50 + "\n\n"
+        parts = ["CATEGORY REPORT", "=" * 50, ""]
          
         if categories:
-            for name, item_count, total_value in categories:
-                report += f"Category: {name}\n"
-                report += f"Number of Items: {item_count or 0}\n"
-                report += f"Total Value: ${total_value or 0:.2f}\n"
-                report += "-" * 30 + "\n"
+            parts.extend(
+                CATEGORY_TMPL.format(name=name, count=item_count or 0, value=total_value or 0)
+                for name, item_count, total_value in categories)
         else:
-            report += "No categories found.\n"
+            parts.append("No categories found.")
          
-        self.report_display.setText(report)
+        self.report_display.setText("\n".join(parts) + "\n")
      
     def export_to_excel(self):
         """Export inventory data to Excel"""
         try:
-            items = self.db_manager.execute_query("""
-                SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.date_added
-                FROM items i LEFT JOIN categories c ON i.category_id = c.id
-            """, fetch=True)
-             
-            if not items:
+            has_items = self.db_manager.execute_query(Q_HAS_ITEMS, fetch=True)
+            if not has_items or not has_items[0][0]:
                 QMessageBox.warning(self, "Warning", "No data to export!")
                 return
              
-            df = pd.DataFrame(items, columns=[
-                'Item Name', 'Category', 'Quantity', 'Price', 'Min Stock', 'Supplier', 'Date Added'
-            ])
-             
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Save Excel File", "inventory_export.xlsx", "Excel Files (*.xlsx)")
              
             if filename:
-                df.to_excel(filename, index=False)
-                QMessageBox.information(self, "Success", f"Data exported to {filename}")
+                self.start_export(ExportWorker(
+                    lambda: self.write_excel(filename),
+                    f"Data exported to {filename}", "Export failed"))
                  
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
@@ -1051,10 +1571,7 @@ class InventoryApp(QMainWindow):
     def export_to_pdf(self):
         """Export inventory data to PDF"""
         try:
-            items = self.db_manager.execute_query("""
-                SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier
-                FROM items i LEFT JOIN categories c ON i.category_id = c.id
-            """, fetch=True)
+            items = self.db_manager.execute_query(Q_EXPORT_PDF, fetch=True)
              
             if not items:
                 QMessageBox.warning(self, "Warning", "No data to export!")
@@ -1064,54 +1581,111 @@ class InventoryApp(QMainWindow):
                 self, "Save PDF File", "inventory_export.pdf", "PDF Files (*.pdf)")
              
             if filename:
-                c = canvas.Canvas(filename, pagesize=letter)
-                width, height = letter
-                 
-                # Title
-                c.setFont("Helvetica-Bold", 16)
-                c.drawString(50, height - 50, "Inventory Report")
-                c.drawString(50, height - 70, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                 
-                # Headers
-                y_position = height - 120
-                c.setFont("Helvetica-Bold", 10)
-                headers = ["Item", "Category", "Qty", "Price", "Min Stock", "Supplier"]
-                x_positions = [50, 150, 250, 300, 350, 420]
-                 
-                for i, header in enumerate(headers):
-                    c.drawString(x_positions[i], y_position, header)
-                 
-                # Data
-                c.setFont("Helvetica", 9)
-                y_position -= 20
-                 
-                for item in items:
-                    if y_position < 50:  # New page if needed
-                        c.showPage()
-                        y_position = height - 50
-                     
-                    for i, value in enumerate(item):
-                        text = str(value or "")[:15]  # Truncate long text
-                        c.drawString(x_positions[i], y_position, text)
-                     
-                    y_position -= 15
-                 
-                c.save()
-                QMessageBox.information(self, "Success", f"PDF exported to {filename}")
+                self.start_export(ExportWorker(
+                    lambda: self.write_pdf(items, filename),
+                    f"PDF exported to {filename}", "PDF export failed"))
                  
         except Exception as e:
             QMessageBox.critical(self, "Error", f"PDF export failed: {str(e)}")
      
+    def start_export(self, worker):
+        """Run an export on the global thread pool so the UI stays responsive"""
+        worker.signals.done.connect(self.export_finished)
+        worker.signals.error.connect(self.export_failed)
+        self.statusBar().showMessage("Exporting...")
+        QThreadPool.globalInstance().start(worker)
+     
+    def export_finished(self, message):
+        self.statusBar().clearMessage()
+        QMessageBox.information(self, "Success", message)
+     
+    def export_failed(self, message):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", message)
+     
+    def write_excel(self, filename):
+        """Write the Excel export; runs on a worker thread"""
+        # constant_memory flushes each row to disk as soon as the next one starts
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, [
+            'Item Name', 'Category', 'Quantity', 'Price', 'Min Stock', 'Supplier', 'Date Added'
+        ])
+        row_index = 1
+        for rows in self.db_manager.stream(Q_EXPORT_EXCEL):
+            for row in rows:
+                worksheet.write_row(row_index, 0, row)
+                row_index += 1
+        workbook.close()
+     
+    def write_pdf(self, items, filename):
+        """Write the PDF export; runs on a worker thread"""
+        c = canvas.Canvas(filename, pagesize=letter)
+        width, height = letter
+
+        # Title
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(50, height - 50, "Inventory Report")
+        c.drawString(50, height - 70, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Headers, padded to the same fixed-width columns as the rows below
+        y_position = height - 120
+        headers = ["Item", "Category", "Qty", "Price", "Min Stock", "Supplier"]
+        widths = [12, 15, 6, 8, 10, 20]
+        c.setFont("Courier-Bold", 9)
+        c.drawString(50, y_position, "".join(h.ljust(w + 1) for h, w in zip(headers, widths)))
+
+        # Data: each row is one Courier line, so columns align by character count
+        # and reportlab draws a single string per row instead of one per cell
+        y_position -= 20
+        text = c.beginText(50, y_position)
+        text.setFont("Courier", 9, leading=11)
+
+        for item in items:
+            if y_position < 50:  # New page if needed
+                c.drawText(text)
+                c.showPage()
+                y_position = height - 50
+                text = c.beginText(50, y_position)
+                text.setFont("Courier", 9, leading=11)
+
+            text.textLine("".join(str(v or "")[:w].ljust(w + 1) for v, w in zip(item, widths)))
+            y_position -= 11
+
+        c.drawText(text)
+        c.save()
+     
     def logout(self):
         """Logout and show login dialog"""
         reply = QMessageBox.question(self, "Confirm Logout", "Are you sure you want to logout?",
                                    QMessageBox.Yes | QMessageBox.No)
          
         if reply == QMessageBox.Yes:
-            self.close()
-            self.__init__()
+            # Reset the existing window instead of re-running __init__, which
+            # opened a second database and rebuilt every tab
+            self.hide()
+            if self.items_table is not None:
+                self.clear_item_form()
+                self.search_input.clear()
+            if self.categories_list is not None:
+                self.clear_category_form()
+            if self.report_display is not None:
+                self.report_display.clear()
+             
+            if not self.login():
+                self.close()
+                return
+             
+            self.load_items()
+            self.load_categories()
+            self.update_dashboard()
             self.show()
  
+    def closeEvent(self, event):
+        """Release the database connection when the window closes"""
+        self.db_manager.close()
+        super().closeEvent(event)
+ 
 # Application Entry Point
 def main():
     app = QApplication(sys.argv)